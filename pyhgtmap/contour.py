@@ -1,4 +1,4 @@
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import contourpy
 import numpy
@@ -128,6 +128,25 @@ class ContoursGenerator(object):
             numOfNodes += numOfNodesAdd
         return resultPaths, numOfNodes, numOfPaths
 
+    def trace_all(
+        self, elevations: Iterable[int]
+    ) -> Tuple[Dict[int, List[numpy.ndarray]], int, int]:
+        """traces contour lines for all the given elevations.
+
+        A dict of paths per elevation is returned, along with the total number of
+        nodes and paths over all elevations.
+        """
+        # Elevations are traced sequentially on purpose: contourpy's serial generator
+        # holds the GIL and isn't thread-safe. Parallelization is done per tile, in
+        # separate processes (see HgtFilesProcessor).
+        pathsPerElev: Dict[int, List[numpy.ndarray]] = {}
+        totalNodes, totalPaths = 0, 0
+        for elevation in elevations:
+            pathsPerElev[elevation], numOfNodes, numOfPaths = self.trace(elevation)
+            totalNodes += numOfNodes
+            totalPaths += numOfPaths
+        return pathsPerElev, totalNodes, totalPaths
+
 
 def build_contours(
     x: numpy.typing.ArrayLike,
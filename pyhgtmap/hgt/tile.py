@@ -1,6 +1,6 @@
 import logging
-from functools import lru_cache
-from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+from functools import cached_property
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import numpy
 import numpy.typing
@@ -35,27 +35,57 @@ class hgtTile:
         """
         self.minLon, self.minLat, self.maxLon, self.maxLat = tile_data["bbox"]
         self.zData = tile_data["data"]
+        if not self.zData.flags["C_CONTIGUOUS"]:
+            # Tiles truncated to an area are strided views on the file's data; work
+            # on a contiguous copy (keeping dtype and mask) for faster scans.
+            self.zData = self.zData.copy(order="C")
         # initialize lists for longitude and latitude data
         self.numOfRows = self.zData.shape[0]
         self.numOfCols = self.zData.shape[1]
         self.lonIncrement, self.latIncrement = tile_data["increments"]
         self.polygons = tile_data["polygon"]
         self.mask = tile_data["mask"]
+        # Scan the polygon and void masks only once; most tiles don't have any
+        self._has_mask: bool = self.mask is not None and bool(numpy.any(self.mask))
+        self._has_voids: bool = bool(numpy.ma.getmask(self.zData).any())
         self.transform = tile_data["transform"]
-        self.xData = numpy.arange(self.numOfCols) * self.lonIncrement + self.minLon
-        self.yData = numpy.arange(self.numOfRows) * self.latIncrement * -1 + self.maxLat
+        self._ele_range: Optional[Tuple[int, int]] = None
         self.minEle, self.maxEle = self.getElevRange()
         self.elevations = None
         self.contourData = None
-        # Use cache local to this instance to avoid memory leak
-        # https://stackoverflow.com/a/68550238
-        self.get_contours = lru_cache(maxsize=16)(self._get_contours)
+        # Contours cache local to this instance, keyed on get_contours() parameters.
+        # Unlike a functools cache, it doesn't hold a reference to the tile and can
+        # be explicitly released with clear_contours().
+        self._contours_cache: Dict[tuple, TileContours] = {}
+
+    @cached_property
+    def xData(self) -> numpy.ndarray:
+        """Longitude of each column, only computed when actually needed."""
+        # Compute in place to avoid allocating temporary arrays
+        xData = numpy.arange(self.numOfCols, dtype=numpy.float64)
+        xData *= self.lonIncrement
+        xData += self.minLon
+        return xData
+
+    @cached_property
+    def yData(self) -> numpy.ndarray:
+        """Latitude of each row, only computed when actually needed."""
+        # Compute in place to avoid allocating temporary arrays
+        yData = numpy.arange(self.numOfRows, dtype=numpy.float64)
+        yData *= -self.latIncrement
+        yData += self.maxLat
+        return yData
+
+    @cached_property
+    def _transformedBbox(self) -> Tuple[float, float, float, float]:
+        """Bounding box in output projection, only transformed once."""
+        return transformLonLats(
+            self.minLon, self.minLat, self.maxLon, self.maxLat, self.transform
+        )
 
     def get_stats(self) -> str:
         """Get some statistics about the tile."""
-        minLon, minLat, maxLon, maxLat = transformLonLats(
-            self.minLon, self.minLat, self.maxLon, self.maxLat, self.transform
-        )
+        minLon, minLat, maxLon, maxLat = self.bbox(doTransform=True)
         result = (
             f"tile with {self.numOfRows:d} x {self.numOfCols:d} points, "
             f"bbox: ({minLon:.2f}, {minLat:.2f}, {maxLon:.2f}, {maxLat:.2f})"
@@ -72,17 +102,21 @@ class hgtTile:
 
         We don't have to care about -0x8000 values here since these are masked
         so that self.zData's min and max methods will yield proper values.
+        Valid values are extracted once, instead of letting each masked reduction
+        build its own filled copy of the data.
+        The result is computed only once and cached.
         """
-        minEle = int(self.zData.min())
-        maxEle = int(self.zData.max())
-        return minEle, maxEle
+        if self._ele_range is None:
+            data = numpy.ma.getdata(self.zData)
+            if self._has_voids:
+                data = data[~numpy.ma.getmask(self.zData)]
+            self._ele_range = int(data.min()), int(data.max())
+        return self._ele_range
 
     def bbox(self, doTransform=True) -> Tuple[float, float, float, float]:
         """returns the bounding box of the current tile."""
         if doTransform:
-            return transformLonLats(
-                self.minLon, self.minLat, self.maxLon, self.maxLat, self.transform
-            )
+            return self._transformedBbox
         else:
             return self.minLon, self.minLat, self.maxLon, self.maxLat
 
@@ -94,7 +128,7 @@ class hgtTile:
         minCont=None,
         maxCont=None,
         rdpEpsilon=None,
-    ) -> Tuple[Iterable[int], ContoursGenerator]:
+    ) -> Tuple[numpy.ndarray, ContoursGenerator]:
         """generates contour lines using matplotlib.
 
         <stepCont> is height difference of contiguous contour lines in meters
@@ -104,37 +138,52 @@ class hgtTile:
         <maxCont>:  upper limit of the range to generate contour lines for
         <rdpEpsilon>: epsilon to use in RDP contour line simplification
 
-        A list of elevations and a ContourObject is returned.
+        An array of elevations and a ContourObject is returned.
         """
 
         def getContLimit(ele: int, step: int) -> int:
             """returns a proper value for the lower or upper limit to generate contour
-            lines for.
+            lines for, ie. <ele> rounded up to a multiple of <step>.
             """
-            if ele % step == 0:
-                return ele
-            corrEle: int = ele + step - ele % step
-            return corrEle
+            return -(-ele // step) * step
 
         min_cont: int = minCont or getContLimit(self.minEle, stepCont)
         max_cont: int = maxCont or getContLimit(self.maxEle, stepCont)
-        levels: Iterable[int]
+        levels: numpy.ndarray = numpy.arange(
+            int(min_cont), int(max_cont), stepCont, dtype=numpy.int32
+        )
         if noZero:
-            levels = [
-                level
-                for level in range(int(min_cont), int(max_cont), stepCont)
-                if level != 0
-            ]
+            levels = levels[levels != 0]
+        z: numpy.typing.ArrayLike
+        if self._has_mask:
+            # Apply the polygon mask as NaN values in a plain float64 array, which
+            # contourpy treats as masked and uses as is, without going through
+            # numpy.ma operations nor another conversion.
+            zFilled: numpy.ndarray = numpy.ma.filled(
+                self.zData.astype(numpy.float64), numpy.nan
+            )
+            zFilled[self.mask] = numpy.nan
+            z = zFilled
+        elif self._has_voids:
+            # No polygon mask to apply; void values are already masked in zData,
+            # and z data is kept in its original dtype (contourpy converts it once
+            # internally).
+            z = self.zData
         else:
-            levels = range(int(min_cont), int(max_cont), stepCont)
-        x, y = numpy.meshgrid(self.xData, self.yData)
-        # z data is a masked array filled with nan.
-        z: numpy.typing.ArrayLike = numpy.ma.array(
-            self.zData, mask=self.mask, fill_value=float("NaN"), keep_mask=True
-        )
+            # Common case of a tile without any void nor polygon mask: hand plain
+            # data over, sparing the masked array handling altogether.
+            z = numpy.ma.getdata(self.zData)
 
+        # contourpy accepts 1D coordinates for a regular grid, no need to build
+        # dense meshgrid arrays.
         contours: ContoursGenerator = build_contours(
-            x, y, z, maxNodesPerWay, self.transform, self.polygons, rdpEpsilon
+            self.xData,
+            self.yData,
+            z,
+            maxNodesPerWay,
+            self.transform,
+            self.polygons,
+            rdpEpsilon,
         )
         return levels, contours
 
@@ -148,13 +197,22 @@ class hgtTile:
             plotFile = open(filename, "w")
         except Exception:
             raise IOError("could not open plot file {0:s} for writing".format(filename))
-        for latIndex, row in enumerate(self.zData):
-            lat = self.maxLat - latIndex * self.latIncrement
-            for lonIndex, height in enumerate(row):
-                lon = self.minLon + lonIndex * self.lonIncrement
-                plotFile.write("{0:.7f} {1:.7f} {2:d}\n".format(lon, lat, height))
-
-    def _get_contours(
+        with plotFile:
+            # Format and write points row by row, latitude being taken from yData.
+            # A single string formatting per row is much faster than formatting
+            # and writing each line separately (as numpy.savetxt does), and avoids
+            # building the whole tile's points array. Void points are skipped.
+            for lat, row in zip(self.yData, self.zData):
+                valid = ~numpy.ma.getmaskarray(row)
+                # Round heights explicitly, as "%d" would truncate them
+                heights = numpy.rint(numpy.ma.getdata(row)[valid])
+                lons = self.xData[valid]
+                points = numpy.column_stack((lons, numpy.full_like(lons, lat), heights))
+                plotFile.write(
+                    ("%.7f %.7f %d\n" * len(points)) % tuple(points.ravel().tolist())
+                )
+
+    def get_contours(
         self,
         step_cont=20,
         max_nodes_per_way=0,
@@ -177,15 +235,21 @@ class hgtTile:
         Returns:
             TileContours: List of contours coordinates, per elevation, and associates statistics
         """
+        key = (step_cont, max_nodes_per_way, no_zero, min_cont, max_cont, rdp_epsilon)
+        if key in self._contours_cache:
+            return self._contours_cache[key]
         elevations, contour_data = self.contourLines(
             step_cont, max_nodes_per_way, no_zero, min_cont, max_cont, rdp_epsilon
         )
-        contours_per_elev: Dict[int, List[numpy.ndarray]] = {}
-        total_nodes, total_ways = 0, 0
-        for elev in elevations:
-            contours_per_elev[elev], nb_nodes, nb_ways = contour_data.trace(elev)
-            total_nodes += nb_nodes
-            total_ways += nb_ways
+        # Use plain Python int elevations as keys, as exposed in TileContours
+        contours_per_elev, total_nodes, total_ways = contour_data.trace_all(
+            elevations.tolist()
+        )
 
         tile_contours = TileContours(total_nodes, total_ways, contours_per_elev)
+        self._contours_cache[key] = tile_contours
         return tile_contours
+
+    def clear_contours(self) -> None:
+        """Release cached contours, which may be huge for big tiles."""
+        self._contours_cache.clear()
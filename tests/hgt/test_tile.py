@@ -45,7 +45,7 @@ class TestHgtTile:
         """Test contour lines extraction from hgt file."""
         assert toulon_tiles_raw
         elevations, contour_data = toulon_tiles_raw[0].contourLines()
-        assert elevations == range(0, 1940, 20)
+        numpy.testing.assert_array_equal(elevations, range(0, 1940, 20))
         assert contour_data
         # Get the countours for 20m elevation
         contour_list_20 = contour_data.trace(20)[0]
@@ -71,6 +71,133 @@ class TestHgtTile:
             ),
         )
 
+    @staticmethod
+    def test_contourLines_noZero(toulon_tiles_raw: List[hgtTile]) -> None:
+        """0 m level must be discarded when noZero is set."""
+        elevations, _ = toulon_tiles_raw[0].contourLines(noZero=True)
+        numpy.testing.assert_array_equal(elevations, range(20, 1940, 20))
+
+    @staticmethod
+    def test_contourLines_mask() -> None:
+        """Polygon mask must only be applied when it actually masks something."""
+        z_data = numpy.ma.array(numpy.arange(0, 160, 10, dtype="float32").reshape(4, 4))
+        tile_data = {
+            "bbox": (0, 0, 3, 3),
+            "data": z_data,
+            "increments": (1, 1),
+            "polygon": None,
+            "mask": numpy.zeros((4, 4), dtype=bool),
+            "transform": None,
+        }
+        _, contour_data = hgtTile(tile_data).contourLines(stepCont=10)
+        assert len(contour_data.trace(25)[0]) == 1
+
+        tile_data["mask"] = numpy.ones((4, 4), dtype=bool)
+        _, contour_data = hgtTile(tile_data).contourLines(stepCont=10)
+        assert contour_data.trace(25)[0] == []
+
+        # Integer data must be supported as well
+        tile_data["data"] = numpy.arange(0, 160, 10, dtype=numpy.int16).reshape(4, 4)
+        tile_data["mask"] = numpy.zeros((4, 4), dtype=bool)
+        tile_data["mask"][0, :] = True
+        _, contour_data = hgtTile(tile_data).contourLines(stepCont=10)
+        assert len(contour_data.trace(25)[0]) == 0
+        assert len(contour_data.trace(65)[0]) == 1
+
+    @staticmethod
+    def test_getElevRange() -> None:
+        """Void values must be ignored when computing elevation range."""
+        z_data = numpy.ma.array(
+            [[-32768, 10], [250, 12]],
+            mask=[[True, False], [False, False]],
+            dtype="float32",
+        )
+        tile = hgtTile(
+            {
+                "bbox": (0, 0, 1, 1),
+                "data": z_data,
+                "increments": (1, 1),
+                "polygon": None,
+                "mask": None,
+                "transform": None,
+            }
+        )
+        assert tile.getElevRange() == (10, 250)
+        assert (tile.minEle, tile.maxEle) == (10, 250)
+
+        # Result is cached
+        tile.zData = None
+        assert tile.getElevRange() == (10, 250)
+
+    @staticmethod
+    def test_zData_contiguous() -> None:
+        """Strided input data must be made contiguous, preserving dtype and mask."""
+        z_data = numpy.ma.array(
+            numpy.arange(16, dtype="float32").reshape(4, 4),
+            mask=numpy.eye(4, dtype=bool),
+        )[:, 1:3]
+        assert not z_data.flags["C_CONTIGUOUS"]
+        tile = hgtTile(
+            {
+                "bbox": (0, 0, 1, 3),
+                "data": z_data,
+                "increments": (1, 1),
+                "polygon": None,
+                "mask": None,
+                "transform": None,
+            }
+        )
+        assert tile.zData.flags["C_CONTIGUOUS"]
+        assert tile.zData.dtype == numpy.float32
+        numpy.testing.assert_array_equal(tile.zData, z_data)
+        numpy.testing.assert_array_equal(tile.zData.mask, z_data.mask)
+
+    @staticmethod
+    def test_bbox_transform_cache() -> None:
+        """Bounding box must be transformed only once."""
+        transform = Mock(side_effect=lambda points: [(x * 2, y * 2) for x, y in points])
+        tile = hgtTile(
+            {
+                "bbox": (0, 0, 1, 1),
+                "data": numpy.ma.array(numpy.zeros((2, 2))),
+                "increments": (1, 1),
+                "polygon": None,
+                "mask": None,
+                "transform": transform,
+            }
+        )
+        assert tile.bbox() == (0, 0, 2, 2)
+        assert tile.bbox(doTransform=False) == (0, 0, 1, 1)
+        assert "bbox: (0.00, 0.00, 2.00, 2.00)" in tile.get_stats()
+        transform.assert_called_once()
+
+    @staticmethod
+    def test_plotData(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Plot data must contain one line per non-void point, with rounded heights."""
+        z_data = numpy.ma.array(
+            [[-32768, -3.7], [328.99, 12.2]],
+            mask=[[True, False], [False, False]],
+            dtype="float32",
+        )
+        tile = hgtTile(
+            {
+                "bbox": (6, 43, 6.5, 43.5),
+                "data": z_data,
+                "increments": (0.5, 0.5),
+                "polygon": None,
+                "mask": None,
+                "transform": None,
+            }
+        )
+        monkeypatch.chdir(tmp_path)
+        tile.plotData("plot")
+        with open(tmp_path / "plot_lon6.00_6.50lat43.00_43.50.xyz") as plot_file:
+            assert plot_file.read().splitlines() == [
+                "6.5000000 43.5000000 -4",
+                "6.0000000 43.0000000 329",
+                "6.5000000 43.0000000 12",
+            ]
+
     @staticmethod
     def test_get_contours(toulon_tiles_raw: List[hgtTile]) -> None:
         """Test contour lines extraction from hgt file."""
@@ -80,6 +207,8 @@ class TestHgtTile:
         assert tile_contours.nb_nodes == 1264395
         assert tile_contours.nb_ways == 10798
         assert tile_contours.contours
+        # Elevations must be plain Python ints
+        assert type(next(iter(tile_contours.contours))) is int
         # Get the countours for 20m elevation
         contour_list_20 = tile_contours.contours[20]
         assert len(contour_list_20) == 145
@@ -118,6 +247,11 @@ class TestHgtTile:
         # contourLines must be called only once thanks to caching
         tile.contourLines.assert_called_once_with(20, 0, False, None, None, None)
 
+        # Contours must be computed again once cache is cleared
+        tile.clear_contours()
+        toulon_tiles_raw[0].get_contours()
+        assert tile.contourLines.call_count == 2
+
     @staticmethod
     # Test contours generation with several rdp_espilon values
     # Results must be close enough not to trigger an exception with mpl plugin